@@ -40,6 +40,7 @@ from .radiation import Radiation
 from .sink_fill import SinkFiller, SinkFillerBarnes
 from .soil_moisture import SoilInfiltrationGreenAmpt, SoilMoisture
 from .space import Space
+from .spatial_disturbance import SpatialDisturbance
 from .spatial_precip import SpatialPrecipitationDistribution
 from .species_evolution import SpeciesEvolver
 from .steepness_index import SteepnessFinder
@@ -104,6 +105,7 @@ COMPONENTS = [
     SoilMoisture,
     SoilInfiltrationGreenAmpt,
     Space,
+    SpatialDisturbance,
     SpatialPrecipitationDistribution,
     SpeciesEvolver,
     SteepnessFinder,
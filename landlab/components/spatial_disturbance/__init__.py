@@ -0,0 +1,5 @@
+from landlab.components.spatial_disturbance.spatial_disturbance import (
+    SpatialDisturbance,
+)
+
+__all__ = ["SpatialDisturbance"]
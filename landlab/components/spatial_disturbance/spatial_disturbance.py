@@ -0,0 +1,386 @@
+import numpy as np
+
+from landlab import Component
+
+_VALID_SCHEMES = set(["zhou_et_al_2013", "ravi_et_al_2009"])
+
+# Plant functional types (PFTs), in the representation used internally by
+# this component (the "ravi_et_al_2009" scheme).  Burnt states are tracked
+# separately from bare soil so that a fire does not re-burn its own scar.
+BARE = 0
+GRASS = 1
+SHRUB = 2
+BURNTGRASS = 3
+BURNTSHRUB = 4
+TREE = 5
+BURNTTREE = 6
+SHRUBSEED = 7
+TREESEED = 8
+
+# Maps each PFT to the state it takes when it burns; non-flammable states
+# (bare and already-burnt cells) map to themselves.
+_BURN_LUT = np.arange(9, dtype=np.int8)
+_BURN_LUT[GRASS] = BURNTGRASS
+_BURN_LUT[SHRUB] = BURNTSHRUB
+_BURN_LUT[TREE] = BURNTTREE
+_BURN_LUT[SHRUBSEED] = BURNTSHRUB
+_BURN_LUT[TREESEED] = BURNTTREE
+
+
+def assert_scheme_is_valid(scheme):
+    if scheme not in _VALID_SCHEMES:
+        raise ValueError("%s: Invalid PFT scheme" % scheme)
+
+
+# Conversion tables between the physical ("zhou_et_al_2013") scheme used
+# by VegCA (grass=0, shrub=1, tree=2, bare=3, shrub_seedling=4,
+# tree_seedling=5) and the disturbance scheme above.  Burnt cells map back
+# to bare soil.
+_PHY_TO_DISTR = np.array([GRASS, SHRUB, TREE, BARE, SHRUBSEED, TREESEED])
+_DISTR_TO_PHY = np.array([3, 0, 1, 3, 3, 2, 3, 4, 5])
+
+
+def convert_phy_pft_to_distr_pft(V):
+    """Convert PFTs from the physical ("zhou_et_al_2013") scheme used by
+    :class:`~.VegCA` to the disturbance scheme used by this component.
+    """
+    return _PHY_TO_DISTR.take(V)
+
+
+def convert_distr_pft_to_phy_pft(V):
+    """Convert PFTs from the disturbance scheme back to the physical
+    ("zhou_et_al_2013") scheme.  Burnt cells are mapped to bare soil.
+    """
+    return _DISTR_TO_PHY.take(V)
+
+
+class SpatialDisturbance(Component):
+    """Simulate spatial disturbances (wildfires and grazing) on a
+    cellular field of plant functional types.
+
+    This component works on the plant functional type (PFT) field
+    produced by the CATGraSS family of models (e.g.
+    :class:`~.VegCA`).  Fires are ignited at random cells and spread
+    from cell to cell through the cell neighborhood, converting
+    vegetated cells into burnt cells with a probability given by the
+    susceptibility of the occupying PFT.  Grazing removes grass
+    occupied cells at random.
+
+    Ref: Ravi, S., D'Odorico, P., Wang, L., White, C. S., Okin, G. S.,
+    Macko, S. A., & Collins, S. L. (2009). Post-fire resource
+    redistribution in desert grasslands: a possible negative feedback
+    on land degradation. Ecosystems, 12(3), 434-444.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from landlab import RasterModelGrid
+    >>> from landlab.components import SpatialDisturbance
+    >>> grid = RasterModelGrid((5, 5))
+    >>> V = grid.add_zeros("vegetation__plant_functional_type", at="cell",
+    ...     dtype=int)
+    >>> sd = SpatialDisturbance(grid)
+    >>> sd.name
+    'Spatial Disturbance'
+
+    All cells are grass; graze with a grazing pressure high enough that
+    every grass cell is removed.
+
+    >>> (V, grazed_cells) = sd.graze(grazing_pressure=1.)
+    >>> np.all(V == 3)
+    True
+    >>> grazed_cells.size == grid.number_of_cells
+    True
+
+    References
+    ----------
+    **Required Software Citation(s) Specific to this Component**
+
+    None Listed
+
+    **Additional References**
+
+    Ravi, S., D'Odorico, P., Wang, L., White, C. S., Okin, G. S., Macko,
+    S. A., and Collins, S. L.: Post-fire resource redistribution in
+    desert grasslands: a possible negative feedback on land degradation,
+    Ecosystems, 12(3), 434-444, doi:10.1007/s10021-009-9233-9, 2009.
+
+    Zhou, X., Istanbulluoglu, E., and Vivoni, E. R.: Modeling the
+    ecohydrological role of aspect-controlled radiation on tree-grass-shrub
+    coexistence in a semiarid climate, Water Resour. Res., 49, 2872-2895,
+    doi:10.1002/wrcr.20259, 2013.
+
+    """
+
+    _name = "Spatial Disturbance"
+
+    _info = {
+        "vegetation__plant_functional_type": {
+            "dtype": int,
+            "intent": "inout",
+            "optional": False,
+            "units": "None",
+            "mapping": "cell",
+            "doc": "classification of plants (int), grass=0, shrub=1, tree=2, bare=3, shrub_seedling=4, tree_seedling=5",
+        }
+    }
+
+    def __init__(self, grid, pft_scheme="zhou_et_al_2013", seed=None):
+        """
+        Parameters
+        ----------
+        grid: RasterModelGrid
+            A grid.
+        pft_scheme: str, optional
+            Encoding of the plant functional type field. Either
+            'zhou_et_al_2013' (the scheme used by VegCA) or
+            'ravi_et_al_2009' (the scheme used internally by this
+            component, which tracks burnt cells).
+        seed: int, optional
+            Seed for the component's random number generator; fires
+            and grazing are reproducible for a given seed.
+        """
+        super(SpatialDisturbance, self).__init__(grid)
+
+        assert_scheme_is_valid(pft_scheme)
+        self._pft_scheme = pft_scheme
+        self._rng = np.random.default_rng(seed)
+        self._neighbors = np.ascontiguousarray(
+            self._grid.looped_neighbors_at_cell, dtype=np.int32
+        )
+        # Scratch buffer marking cells already considered by the fire
+        # currently spreading; zeroed again after each fire.
+        self._visited = np.zeros(grid.number_of_cells, dtype=np.uint8)
+        # Default (uniform) susceptibility, shared by every call to
+        # _spread_fire that does not supply its own.
+        self._default_susc = np.ones(grid.number_of_cells)
+
+    def graze(self, V=None, grazing_pressure=0.01):
+        """Remove grass from randomly selected cells.
+
+        Parameters
+        ----------
+        V: numpy.ndarray, optional
+            Field of PFTs at cells. If not given, the field
+            'vegetation__plant_functional_type' is used and updated
+            in place on the grid.
+        grazing_pressure: float, optional
+            Probability that a grass-occupied cell is grazed.
+
+        Returns
+        -------
+        tuple of (ndarray of int, ndarray of int)
+            The updated PFT field and the ids of the grazed cells.
+        """
+        from_grid = V is None
+        if from_grid:
+            V = self._grid.at_cell["vegetation__plant_functional_type"]
+        if self._pft_scheme == "zhou_et_al_2013":
+            V = convert_phy_pft_to_distr_pft(V)
+
+        grz_prob = grazing_pressure + 0.6 * grazing_pressure * self._rng.random()
+        grass_cells = np.flatnonzero(V == GRASS)
+        compute_ = self._rng.random(grass_cells.shape)
+        grazed_cells = grass_cells[compute_ < grz_prob]
+        V[grazed_cells] = BARE
+
+        if self._pft_scheme == "zhou_et_al_2013":
+            V = convert_distr_pft_to_phy_pft(V)
+        if from_grid:
+            self._grid.at_cell["vegetation__plant_functional_type"][:] = V
+
+        return (V, grazed_cells)
+
+    def initiate_fires(
+        self,
+        V=None,
+        n_fires=2,
+        fire_area_mean=0.0625,
+        fire_area_dev=0.01,
+        sh_susc=1.0,
+        tr_susc=1.0,
+        gr_susc=1.0,
+        sh_seed_susc=1.0,
+        tr_seed_susc=1.0,
+        gr_vuln=1.0,
+        sh_vuln=0.0,
+        tr_vuln=0.0,
+        sh_seed_vuln=0.0,
+        tr_seed_vuln=0.0,
+    ):
+        """Ignite fires at random cells and spread them.
+
+        For each of `n_fires` attempts an ignition cell is chosen at
+        random; the fire starts with a probability given by the
+        vulnerability of the PFT occupying that cell, and then spreads
+        from cell to cell with a probability given by the
+        susceptibility of each neighbor, until a target burnt area -
+        drawn uniformly from `fire_area_mean` +/- `fire_area_dev`
+        (as a fraction of the grid) - is reached.
+
+        Parameters
+        ----------
+        V: numpy.ndarray, optional
+            Field of PFTs at cells. If not given, the field
+            'vegetation__plant_functional_type' is used and updated
+            in place on the grid.
+        n_fires: int, optional
+            Number of ignition attempts.
+        fire_area_mean: float, optional
+            Mean fraction of the grid burnt by a single fire.
+        fire_area_dev: float, optional
+            Half-width of the uniform distribution around
+            `fire_area_mean`.
+        sh_susc, tr_susc, gr_susc, sh_seed_susc, tr_seed_susc: float, optional
+            Susceptibility of shrubs, trees, grass, shrub seedlings,
+            and tree seedlings to catch fire from a burning neighbor.
+        gr_vuln, sh_vuln, tr_vuln, sh_seed_vuln, tr_seed_vuln: float, optional
+            Vulnerability of grass, shrubs, trees, shrub seedlings,
+            and tree seedlings to ignite.
+
+        Returns
+        -------
+        tuple of (ndarray of int, ndarray of int, list of int)
+            The updated PFT field, the ids of all burnt cells, and the
+            ids of the cells where fires ignited.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from landlab import RasterModelGrid
+        >>> from landlab.components import SpatialDisturbance
+        >>> grid = RasterModelGrid((6, 6))
+        >>> V = grid.add_zeros("vegetation__plant_functional_type", at="cell",
+        ...     dtype=int)
+        >>> sd = SpatialDisturbance(grid)
+        >>> (V, burnt_locs, ignition_cells) = sd.initiate_fires(
+        ...     n_fires=1, fire_area_mean=1., fire_area_dev=0.)
+        >>> np.all(V == 3)
+        True
+        >>> len(burnt_locs) == grid.number_of_cells
+        True
+        >>> len(ignition_cells)
+        1
+        """
+        from_grid = V is None
+        if from_grid:
+            V = self._grid.at_cell["vegetation__plant_functional_type"]
+        if self._pft_scheme == "zhou_et_al_2013":
+            V = convert_phy_pft_to_distr_pft(V)
+
+        vuln = np.array(
+            [0.0, gr_vuln, sh_vuln, 0.0, 0.0, tr_vuln, 0.0, sh_seed_vuln, tr_seed_vuln]
+        )
+        susc = self._set_susceptibility(
+            V,
+            sh_susc=sh_susc,
+            tr_susc=tr_susc,
+            gr_susc=gr_susc,
+            sh_seed_susc=sh_seed_susc,
+            tr_seed_susc=tr_seed_susc,
+        )
+        # Draw all ignition candidates and their ignition rolls up front;
+        # whether a candidate actually ignites still depends on the state
+        # the earlier fires leave behind.
+        candidate_cells = self._rng.integers(0, self._grid.number_of_cells, n_fires)
+        ignition_rolls = self._rng.random(n_fires)
+        ignition_cells = []
+        burnt_locs = []
+        for i in range(n_fires):
+            ignition_cell = int(candidate_cells[i])
+            if ignition_rolls[i] < vuln[int(V[ignition_cell])]:
+                (fire_locs, V) = self._spread_fire(
+                    V,
+                    ignition_cell,
+                    fire_area_mean=fire_area_mean,
+                    fire_area_dev=fire_area_dev,
+                    susc=susc,
+                )
+                # burnt cells cannot catch fire again
+                susc[fire_locs] = 0.0
+                burnt_locs.append(fire_locs)
+                ignition_cells.append(ignition_cell)
+
+        if burnt_locs:
+            burnt_locs = np.concatenate(burnt_locs)
+        else:
+            burnt_locs = np.array([], dtype=np.int32)
+
+        if self._pft_scheme == "zhou_et_al_2013":
+            V = convert_distr_pft_to_phy_pft(V)
+        if from_grid:
+            self._grid.at_cell["vegetation__plant_functional_type"][:] = V
+
+        return (V, burnt_locs, ignition_cells)
+
+    def _spread_fire(
+        self, V, ignition_cell, fire_area_mean=0.0625, fire_area_dev=0.01, susc=None
+    ):
+        """Spread a fire from `ignition_cell` ring by ring.
+
+        Returns a tuple of the ids of the burnt cells and the updated
+        PFT field.
+        """
+        if susc is None:
+            susc = self._default_susc
+
+        V = self._burn_veg(V, [ignition_cell])
+        fire_locs = np.empty(self._grid.number_of_cells, dtype=np.int32)
+        fire_locs[0] = ignition_cell
+        fl = 1
+        visited = self._visited
+        visited[ignition_cell] = 1
+        touched = [np.array([ignition_cell])]
+        burning_cells = np.array([ignition_cell])
+        fire_burnt = 1
+        max_burnt = (
+            self._fetch_uniform_random_fire_area(fire_area_mean, fire_area_dev)
+            * self._grid.number_of_cells
+        )
+        # One uniform draw per cell is enough for the whole fire: the
+        # visited mask guarantees each cell consumes at most one value.
+        rand_buf = self._rng.random(self._grid.number_of_cells)
+        ri = 0
+        while fire_burnt < max_burnt:
+            # expand the whole ring at once: every neighbor of every
+            # burning cell, minus bare cells and cells already considered
+            neighbors = self._neighbors[burning_cells].reshape(-1)
+            veg_neighbors = neighbors[V[neighbors] != BARE]
+            candidates = np.unique(veg_neighbors[visited[veg_neighbors] == 0])
+            visited[candidates] = 1
+            touched.append(candidates)
+            rand_val = rand_buf[ri : ri + candidates.size]
+            ri += candidates.size
+            newly_burnt = candidates[rand_val < susc[candidates]]
+            if newly_burnt.size == 0:
+                break
+            burning_cells = newly_burnt
+            V = self._burn_veg(V, newly_burnt)
+            fire_locs[fl : fl + newly_burnt.size] = newly_burnt
+            fl += newly_burnt.size
+            fire_burnt += newly_burnt.shape[0]
+        visited[np.concatenate(touched)] = 0
+        return (fire_locs[:fl], V)
+
+    def _fetch_uniform_random_fire_area(self, fire_area_mean, fire_area_dev):
+        """Draw a fire area from `fire_area_mean` +/- `fire_area_dev`."""
+        a = fire_area_mean - fire_area_dev
+        return a + 2 * fire_area_dev * self._rng.random()
+
+    def _burn_veg(self, V, newly_burnt):
+        """Convert the PFTs of `newly_burnt` cells to their burnt states."""
+        newly_burnt = np.asarray(newly_burnt, dtype=int)
+        V[newly_burnt] = _BURN_LUT[V[newly_burnt]]
+        return V
+
+    def _set_susceptibility(
+        self, V, sh_susc=1.0, tr_susc=1.0, gr_susc=1.0, sh_seed_susc=1.0, tr_seed_susc=1.0
+    ):
+        """Map PFTs at cells to their susceptibility to catch fire."""
+        lut = np.zeros(9)
+        lut[GRASS] = gr_susc
+        lut[SHRUB] = sh_susc
+        lut[TREE] = tr_susc
+        lut[SHRUBSEED] = sh_seed_susc
+        lut[TREESEED] = tr_seed_susc
+        return lut[V]
@@ -1,4 +1,5 @@
 import re
+from itertools import chain
 
 import numpy as np
 import xarray as xr
@@ -9,6 +10,20 @@ from ...utils import jaggedarray
 from ..sort.intpair import pair_isin
 from ..sort.sort import reverse_one_to_one
 
+_MESH_DIMS = ("node", "link", "patch", "corner", "face", "cell")
+
+_ID_PREFIX_PATTERNS = {
+    at: re.compile(
+        "^{at}(es)?_at_".format(at=at)
+        if at == "patch"
+        else "^{at}(s)?_at_".format(at=at)
+    )
+    for at in _MESH_DIMS
+}
+_ID_SUFFIX_PATTERNS = {
+    at: re.compile("at_{at}$".format(at=at)) for at in _MESH_DIMS
+}
+
 
 class VoronoiDelaunay(object):
     def __init__(self, xy_of_node):
@@ -30,9 +45,17 @@ class VoronoiDelaunay(object):
         # ridge_points == nodes_at_face
         # point_region == node_at_cell
 
+        # Qhull wants C-contiguous doubles; convert once and share the
+        # buffer between the two triangulations.
+        xy_of_node = np.ascontiguousarray(xy_of_node, dtype=float)
+
         delaunay = Delaunay(xy_of_node)
         voronoi = Voronoi(xy_of_node)
 
+        (corners_at_cell, n_corners_at_cell) = self._corners_at_cell(voronoi.regions)
+
+        # Assemble the whole dataset in one go: every Dataset.update
+        # re-validates and re-indexes all of the existing variables.
         mesh = xr.Dataset(
             {
                 "node": xr.DataArray(
@@ -55,10 +78,6 @@ class VoronoiDelaunay(object):
                     },
                     dims=("corner",),
                 ),
-            }
-        )
-        mesh.update(
-            {
                 "nodes_at_link": xr.DataArray(
                     as_id_array(voronoi.ridge_points), dims=("link", "Two")
                 ),
@@ -69,12 +88,9 @@ class VoronoiDelaunay(object):
                     voronoi.ridge_vertices, dims=("face", "Two")
                 ),
                 "corners_at_cell": xr.DataArray(
-                    self._corners_at_cell(voronoi.regions),
-                    dims=("cell", "max_corners_per_cell"),
-                ),
-                "n_corners_at_cell": xr.DataArray(
-                    [len(cell) for cell in voronoi.regions], dims=("cell",)
+                    corners_at_cell, dims=("cell", "max_corners_per_cell")
                 ),
+                "n_corners_at_cell": xr.DataArray(n_corners_at_cell, dims=("cell",)),
                 "nodes_at_face": xr.DataArray(
                     np.asarray(voronoi.ridge_points, dtype=int), dims=("face", "Two")
                 ),
@@ -84,13 +100,37 @@ class VoronoiDelaunay(object):
             }
         )
         self._mesh = mesh
+        self._ids_with_prefix = {at: set() for at in _MESH_DIMS}
+        self._ids_with_suffix = {at: set() for at in _MESH_DIMS}
+        self._index_fields(mesh.variables)
+
+    def _index_fields(self, names):
+        """Record, for each element, which variables hold ids of that
+        element and which are defined on it, so deletions need not
+        re-scan (and re-match) every mesh variable.
+        """
+        for name in names:
+            for at in _MESH_DIMS:
+                if _ID_PREFIX_PATTERNS[at].search(name):
+                    self._ids_with_prefix[at].add(name)
+                if _ID_SUFFIX_PATTERNS[at].search(name):
+                    self._ids_with_suffix[at].add(name)
 
     @staticmethod
     def _corners_at_cell(regions):
-        jagged = jaggedarray.JaggedArray(regions)
-        return np.asarray(
-            jaggedarray.unravel(jagged.array, jagged.offset, pad=-1), dtype=int
+        """Return the padded corners-at-cell matrix along with the
+        number of corners for each cell, counting the regions only once.
+        """
+        n_corners_at_cell = np.fromiter(
+            (len(cell) for cell in regions), dtype=int, count=len(regions)
         )
+        offset = np.empty(len(regions) + 1, dtype=int)
+        offset[0] = 0
+        np.cumsum(n_corners_at_cell, out=offset[1:])
+        corners = np.fromiter(
+            chain.from_iterable(regions), dtype=int, count=offset[-1]
+        )
+        return (jaggedarray.unravel(corners, offset, pad=-1), n_corners_at_cell)
 
     @property
     def number_of_nodes(self):
@@ -168,6 +208,9 @@ class VoronoiDelaunayToGraph(VoronoiDelaunay):
         if perimeter_links is not None:
             perimeter_links = np.asarray(perimeter_links, dtype=int)
         self._perimeter_links = perimeter_links
+        # Memoized is_perimeter_* results; cleared whenever elements are
+        # dropped since deletions rewrite the id arrays they are based on.
+        self._perimeter_cache = {}
 
         mesh = self._mesh
         mesh.update(
@@ -181,10 +224,6 @@ class VoronoiDelaunayToGraph(VoronoiDelaunay):
                 "node_at_cell": xr.DataArray(
                     reverse_one_to_one(mesh["cell_at_node"].data), dims=("cell",)
                 ),
-            }
-        )
-        mesh.update(
-            {
                 "faces_at_cell": xr.DataArray(
                     self._links_at_patch(
                         mesh["corners_at_face"].data,
@@ -192,9 +231,10 @@ class VoronoiDelaunayToGraph(VoronoiDelaunay):
                         n_links_at_patch=self.n_corners_at_cell,
                     ),
                     dims=("cell", "max_faces_per_cell"),
-                )
+                ),
             }
         )
+        self._index_fields(("links_at_patch", "node_at_cell", "faces_at_cell"))
 
         self.drop_corners(self.unbound_corners())
         self.drop_perimeter_faces()
@@ -202,41 +242,82 @@ class VoronoiDelaunayToGraph(VoronoiDelaunay):
 
     @staticmethod
     def _links_at_patch(nodes_at_link, nodes_at_patch, n_links_at_patch=None):
-        from ..sort.intpair import map_rolling_pairs_to_values
+        nodes_at_link = np.asarray(nodes_at_link)
+        nodes_at_patch = np.asarray(nodes_at_patch)
+        (n_patches, n_cols) = nodes_at_patch.shape
 
-        return map_rolling_pairs_to_values(
-            (nodes_at_link, np.arange(len(nodes_at_link))),
-            nodes_at_patch,
-            size_of_row=n_links_at_patch,
-            # (nodes_at_link[link_at_nodes], link_at_nodes), nodes_at_patch, sorted=True
+        if n_links_at_patch is None:
+            n_links_at_patch = np.full(n_patches, n_cols, dtype=int)
+        else:
+            n_links_at_patch = np.asarray(n_links_at_patch)
+
+        # Encode each unordered node pair as a single int64 key so the
+        # rolling pairs of every patch can be looked up in one batched
+        # searchsorted instead of pair-at-a-time binary searches.
+        n_keys = max(int(nodes_at_link.max()), int(nodes_at_patch.max())) + 2
+
+        def key_of_pair(a, b):
+            return (
+                np.minimum(a, b).astype(np.int64) * n_keys
+                + np.maximum(a, b)
+            )
+
+        key_at_link = key_of_pair(nodes_at_link[:, 0], nodes_at_link[:, 1])
+        sorter = np.argsort(key_at_link)
+        sorted_keys = key_at_link[sorter]
+
+        cols = np.arange(n_cols)
+        is_a_pair = cols < n_links_at_patch[:, None]
+        next_col = np.where(cols + 1 >= n_links_at_patch[:, None], 0, cols + 1)
+        key_at_pair = key_of_pair(
+            nodes_at_patch, np.take_along_axis(nodes_at_patch, next_col, axis=1)
+        )
+
+        index = np.searchsorted(sorted_keys, key_at_pair).clip(
+            max=len(sorted_keys) - 1
         )
+        is_a_pair &= sorted_keys[index] == key_at_pair
+
+        return np.where(is_a_pair, sorter[index], -1)
 
     def is_perimeter_face(self):
-        return np.any(self.corners_at_face == -1, axis=1)
+        if "face" not in self._perimeter_cache:
+            self._perimeter_cache["face"] = np.any(
+                self.corners_at_face == -1, axis=1
+            )
+        return self._perimeter_cache["face"]
 
     def is_perimeter_cell(self):
         from .ext.voronoi import id_array_contains
 
-        is_perimeter_cell = np.empty(len(self.n_corners_at_cell), dtype=bool)
-        id_array_contains(
-            self.corners_at_cell,
-            self.n_corners_at_cell,
-            -1,
-            is_perimeter_cell.view(dtype=np.uint8),
-        )
-        is_perimeter_cell |= self.n_corners_at_cell < 3
+        if "cell" not in self._perimeter_cache:
+            is_perimeter_cell = np.empty(len(self.n_corners_at_cell), dtype=bool)
+            id_array_contains(
+                self.corners_at_cell,
+                self.n_corners_at_cell,
+                -1,
+                is_perimeter_cell.view(dtype=np.uint8),
+            )
+            is_perimeter_cell |= self.n_corners_at_cell < 3
+            self._perimeter_cache["cell"] = is_perimeter_cell
 
-        return is_perimeter_cell
+        return self._perimeter_cache["cell"]
 
     def is_perimeter_link(self):
-        if self._perimeter_links is not None:
-            is_perimeter_link = pair_isin(self._perimeter_links, self.nodes_at_link)
-        else:
-            is_perimeter_link = self.is_perimeter_face()
-        return is_perimeter_link
+        if "link" not in self._perimeter_cache:
+            if self._perimeter_links is not None:
+                is_perimeter_link = pair_isin(
+                    self._perimeter_links, self.nodes_at_link
+                )
+            else:
+                is_perimeter_link = self.is_perimeter_face()
+            self._perimeter_cache["link"] = is_perimeter_link
+        return self._perimeter_cache["link"]
 
     def unbound_corners(self):
-        faces_to_drop = np.where(self.is_perimeter_face() & ~self.is_perimeter_link())
+        faces_to_drop = np.flatnonzero(
+            self.is_perimeter_face() & ~self.is_perimeter_link()
+        )
 
         unbound_corners = self.corners_at_face[faces_to_drop].reshape((-1,))
 
@@ -258,43 +339,38 @@ class VoronoiDelaunayToGraph(VoronoiDelaunay):
 
         # Remove bad links
         is_a_link = np.any(self._mesh["corners_at_face"].data != -1, axis=1)
-        self.drop_element(np.where(~is_a_link)[0], at="link")
+        self.drop_element(np.flatnonzero(~is_a_link), at="link")
 
         # Remove the bad patches
         is_a_patch = np.all(self._mesh["links_at_patch"] >= 0, axis=1)
-        self.drop_element(np.where(~is_a_patch)[0], at="patch")
+        self.drop_element(np.flatnonzero(~is_a_patch), at="patch")
 
     def drop_perimeter_faces(self):
-        self.drop_element(np.where(self.is_perimeter_face())[0], at="face")
+        self.drop_element(np.flatnonzero(self.is_perimeter_face()), at="face")
 
     def drop_perimeter_cells(self):
-        self.drop_element(np.where(self.is_perimeter_cell())[0], at="cell")
+        self.drop_element(np.flatnonzero(self.is_perimeter_cell()), at="cell")
 
     def ids_with_prefix(self, at):
-        matches = set()
-        if at == "patch":
-            prefix = re.compile("^{at}(es)?_at_".format(at=at))
-        else:
-            prefix = re.compile("^{at}(s)?_at_".format(at=at))
-        for name, var in self._mesh.variables.items():
-            if prefix.search(name):
-                matches.add(name)
-        return matches
+        return set(self._ids_with_prefix[at])
 
     def ids_with_suffix(self, at):
-        matches = set()
-        suffix = re.compile("at_{at}$".format(at=at))
-        for name, var in self._mesh.variables.items():
-            if suffix.search(name):
-                matches.add(name)
-        return matches
+        return set(self._ids_with_suffix[at])
 
     def drop_element(self, ids, at="node"):
         dropped_ids = np.asarray(ids, dtype=int)
+        if len(dropped_ids) > 0:
+            self._perimeter_cache.clear()
         dropped_ids.sort()
         is_a_keeper = np.full(self._mesh.dims[at], True)
         is_a_keeper[dropped_ids] = False
 
+        # Renumbering table mapping old ids to compacted new ids, with
+        # dropped ids mapping to -1. The extra trailing slot lets -1
+        # sentinels already present in a field map back to -1.
+        new_id = np.full(len(is_a_keeper) + 1, -1, dtype=int)
+        new_id[:-1][is_a_keeper] = np.arange(int(is_a_keeper.sum()))
+
         at_ = {}
         if at in self._mesh.coords:
             x = self._mesh["x_of_{at}".format(at=at)].values[is_a_keeper]
@@ -323,9 +399,7 @@ class VoronoiDelaunayToGraph(VoronoiDelaunay):
         for name in self.ids_with_prefix(at):
             var = self._mesh[name]
             array = var.values.reshape((-1,))
-            array[np.in1d(array, dropped_ids)] = -1
-            for id_ in dropped_ids[::-1]:
-                array[array > id_] -= 1
+            array[:] = new_id[array]
 
     @property
     def links_at_patch(self):
@@ -0,0 +1,110 @@
+"""
+Unit tests for landlab.components.spatial_disturbance.spatial_disturbance
+"""
+import numpy as np
+import pytest
+
+from landlab.components.spatial_disturbance.spatial_disturbance import (
+    BARE,
+    BURNTGRASS,
+    BURNTSHRUB,
+    BURNTTREE,
+    GRASS,
+    SHRUB,
+    SHRUBSEED,
+    TREE,
+    TREESEED,
+    convert_distr_pft_to_phy_pft,
+    convert_phy_pft_to_distr_pft,
+)
+
+
+def test_name(sd):
+    assert sd.name == "Spatial Disturbance"
+
+
+def test_input_var_names(sd):
+    assert sorted(sd.input_var_names) == ["vegetation__plant_functional_type"]
+
+
+def test_var_units(sd):
+    assert sd.var_units("vegetation__plant_functional_type") == "None"
+
+
+def test_invalid_scheme():
+    from landlab import RasterModelGrid
+    from landlab.components import SpatialDisturbance
+
+    grid = RasterModelGrid((20, 20))
+    grid.add_zeros("vegetation__plant_functional_type", at="cell", dtype=int)
+    with pytest.raises(ValueError):
+        SpatialDisturbance(grid, pft_scheme="not_a_scheme")
+
+
+def test_pft_conversion_round_trip():
+    phy = np.array([0, 1, 2, 3, 4, 5])
+    distr = convert_phy_pft_to_distr_pft(phy)
+    assert np.all(distr == [GRASS, SHRUB, TREE, BARE, SHRUBSEED, TREESEED])
+    assert np.all(convert_distr_pft_to_phy_pft(distr) == phy)
+
+
+def test_burnt_pfts_convert_to_bare():
+    distr = np.array([BURNTGRASS, BURNTSHRUB, BURNTTREE])
+    assert np.all(convert_distr_pft_to_phy_pft(distr) == 3)
+
+
+def test_graze_removes_all_grass(sd):
+    (V, grazed_cells) = sd.graze(grazing_pressure=1.0)
+    assert np.all(V == 3)
+    assert grazed_cells.size == sd.grid.number_of_cells
+    assert np.all(sd.grid.at_cell["vegetation__plant_functional_type"] == 3)
+
+
+def test_graze_leaves_non_grass_alone(sd):
+    V = sd.grid.at_cell["vegetation__plant_functional_type"]
+    V[:] = 1  # all shrub
+    (V, grazed_cells) = sd.graze(grazing_pressure=1.0)
+    assert np.all(V == 1)
+    assert grazed_cells.size == 0
+
+
+def test_fire_burns_whole_grid(sd):
+    (V, burnt_locs, ignition_cells) = sd.initiate_fires(
+        n_fires=1, fire_area_mean=1.0, fire_area_dev=0.0
+    )
+    assert np.all(V == 3)
+    assert sorted(burnt_locs) == list(range(sd.grid.number_of_cells))
+    assert len(ignition_cells) == 1
+
+
+def test_fire_does_not_ignite_on_bare(sd):
+    V = sd.grid.at_cell["vegetation__plant_functional_type"]
+    V[:] = 3  # all bare
+    (V, burnt_locs, ignition_cells) = sd.initiate_fires(n_fires=5)
+    assert burnt_locs.size == 0
+    assert ignition_cells == []
+    assert np.all(V == 3)
+
+
+def test_fires_are_reproducible_with_seed():
+    from landlab import RasterModelGrid
+    from landlab.components import SpatialDisturbance
+
+    results = []
+    for _ in range(2):
+        grid = RasterModelGrid((20, 20))
+        grid.add_zeros("vegetation__plant_functional_type", at="cell", dtype=int)
+        sd = SpatialDisturbance(grid, seed=42)
+        (V, burnt_locs, ignition_cells) = sd.initiate_fires(n_fires=3)
+        results.append((V, burnt_locs, ignition_cells))
+    assert np.all(results[0][0] == results[1][0])
+    assert np.all(results[0][1] == results[1][1])
+    assert results[0][2] == results[1][2]
+
+
+def test_burn_veg_maps_pfts_to_burnt_states(sd):
+    V = np.array([GRASS, SHRUB, TREE, SHRUBSEED, TREESEED, BARE])
+    V = sd._burn_veg(V, np.arange(6))
+    assert np.all(
+        V == [BURNTGRASS, BURNTSHRUB, BURNTTREE, BURNTSHRUB, BURNTTREE, BARE]
+    )